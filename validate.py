@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 
 import argparse
+import concurrent.futures
+import contextlib
+import io
 import json
 import jsonschema
 import os
+import pathlib
 import sys
 import re
 
@@ -11,6 +15,14 @@ PACK_DIR="pack"
 SCHEMA_DIR="schema"
 formatting_errors = 0
 validation_errors = 0
+worker_state = None
+
+# Encoder used by format_json, json.dumps() would build a new one on every call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, indent=4, separators=(',', ': '))
+# Indentation patterns used by format_json, deepest level first
+_INDENT_RES = tuple((re.compile(b"^" + (b"    " * i), re.MULTILINE), b"\t" * i) for i in range(8, 0, -1))
+# Typographic quotes and dashes replaced by format_json in a single translate() pass
+_SMART_PUNCT = str.maketrans({u"\u2018": "'", u"\u2019": "'", u"\u2212": "-", u"\u2013": "-"})
 
 def check_dir_access(path):
     if not os.path.isdir(path):
@@ -34,73 +46,90 @@ def check_json_schema(args, data, path):
         jsonschema.Draft4Validator.check_schema(data)
         return True
     except jsonschema.exceptions.SchemaError as e:
-        verbose_print(args, "%s: Schema file is not valid Draft 4 JSON schema.\n" % path, 0)
+        verbose_print(args, 0, "%s: Schema file is not valid Draft 4 JSON schema.\n", path)
         validation_errors += 1
-        verbose_print(args, "%s\n" % e.message, 0)
+        verbose_print(args, 0, "%s\n", e.message)
         return False
 
-def custom_card_check(args, card, pack_code, factions_data, types_data):
+def schema_validator(schema):
+    "Checks the schema and builds a validator for it. Build it once per schema and reuse it for every item validated against it."
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def validate_with(validator, instance):
+    "Same as jsonschema.validate(), but with a validator obtained from schema_validator()."
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+def custom_card_check(args, card, pack_code, faction_codes, type_codes):
     "Performs more in-depth sanity checks than jsonschema validator is capable of. Assumes that the basic schema validation has already completed successfully."
     if card["pack_code"] != pack_code:
         raise jsonschema.ValidationError("Pack code '%s' of the card '%s' doesn't match the pack code '%s' of the file it appears in." % (card["pack_code"], card["code"], pack_code))
-    if card.get("faction_code") and card["faction_code"] not in [f["code"] for f in factions_data]:
-        raise jsonschema.ValidationError("Faction code '%s' of the pack '%s' doesn't match any valid faction code." % (card["faction_code"], card["code"]))
-    if card.get("type_code") and  card["type_code"] not in [f["code"] for f in types_data]:
-        raise jsonschema.ValidationError("Faction code '%s' of the pack '%s' doesn't match any valid type code." % (card["type_code"], card["code"]))
-
-def custom_pack_check(args, pack, cycles_data):
-   if pack["cycle_code"] not in [c["code"] for c in cycles_data]:
+    faction_code = card.get("faction_code")
+    if faction_code and faction_code not in faction_codes:
+        raise jsonschema.ValidationError("Faction code '%s' of the pack '%s' doesn't match any valid faction code." % (faction_code, card["code"]))
+    type_code = card.get("type_code")
+    if type_code and type_code not in type_codes:
+        raise jsonschema.ValidationError("Faction code '%s' of the pack '%s' doesn't match any valid type code." % (type_code, card["code"]))
+
+def custom_pack_check(args, pack, cycle_codes):
+   if pack["cycle_code"] not in cycle_codes:
         raise jsonschema.ValidationError("Cycle code '%s' of the pack '%s' doesn't match any valid cycle code." % (pack["cycle_code"], pack["code"]))
 
 def format_json(json_data):
-    formatted_data = json.dumps(json_data, ensure_ascii=False, sort_keys=True, indent=4, separators=(',', ': '))
-    formatted_data = formatted_data.replace(u"\u2018", "'").replace(u"\u2019", "'")
-    formatted_data = formatted_data.replace(u"\u2212", "-").replace(u"\u2013", "-")
-    formatted_data = formatted_data.replace("\\r\\n", "\\n").replace(" \\n", "\\n")
-    formatted_data = formatted_data.replace("][", "] [")
-    for i in range(8, 0, -1):
-         formatted_data = re.sub("^" + ("    " * i), "\t" * i, formatted_data, flags=re.MULTILINE)
-    formatted_data += "\n"
+    "Returns the canonical formatting of json_data as utf-8 encoded bytes, ready to be compared with or written to a file."
+    formatted_data = _JSON_ENCODER.encode(json_data).translate(_SMART_PUNCT).encode("utf-8")
+    formatted_data = formatted_data.replace(b"\\r\\n", b"\\n").replace(b" \\n", b"\\n")
+    formatted_data = formatted_data.replace(b"][", b"] [")
+    for pat, repl in _INDENT_RES:
+        formatted_data = pat.sub(repl, formatted_data)
+    formatted_data += b"\n"
     return formatted_data
 
 def load_json_file(args, path):
     global formatting_errors
     global validation_errors
     try:
-        with open(path, "rb") as data_file:
-            bin_data = data_file.read()
-        raw_data = bin_data.decode("utf-8")
-        json_data = json.loads(raw_data)
+        bin_data = pathlib.Path(path).read_bytes()
+        # json.loads() would guess the encoding of bytes, only accept utf-8
+        json_data = json.loads(bin_data.decode("utf-8"))
     except ValueError as e:
-        verbose_print(args, "%s: File is not valid JSON.\n" % path, 0)
+        verbose_print(args, 0, "%s: File is not valid JSON.\n", path)
         validation_errors += 1
-        verbose_print(args, "%s\n" % e.message, 0)
+        verbose_print(args, 0, "%s\n", e.message)
         return None
 
-    verbose_print(args, "%s: Checking JSON formatting...\n" % path, 1)
-    formatted_raw_data = format_json(json_data)
-
-    if "<sup>" in formatted_raw_data:
-        verbose_print(args, "%s: File contains invalid content (<sup>)\n" % path, 0)
+    # The raw bytes catch the usual case, only re-serialize when part of the
+    # markup may be hidden behind a \u escape
+    if b"<sup>" in bin_data or (b"\\u" in bin_data and "<sup>" in _JSON_ENCODER.encode(json_data)):
+        verbose_print(args, 0, "%s: File contains invalid content (<sup>)\n", path)
         validation_errors += 1
         return None
 
-    if formatted_raw_data != raw_data:
-        ##verbose_print(args, "%s: File is not correctly formatted JSON.\n" % path, 0)
+    # Formatting mismatches are not counted as errors, so only re-serialize
+    # the document when we are going to write the result back
+    if not args.fix_formatting:
+        return json_data
+
+    verbose_print(args, 1, "%s: Checking JSON formatting...\n", path)
+    formatted_data = format_json(json_data)
+
+    if formatted_data != bin_data:
+        ##verbose_print(args, 0, "%s: File is not correctly formatted JSON.\n", path)
         formatting_errors += 0
-        if args.fix_formatting and len(formatted_raw_data) > 0:
-            verbose_print(args, "%s: Fixing JSON formatting...\n" % path, 0)
+        if len(formatted_data) > 0:
+            verbose_print(args, 0, "%s: Fixing JSON formatting...\n", path)
             try:
-                with open(path, "wb") as json_file:
-                    bin_formatted_data = formatted_raw_data.encode("utf-8")
-                    json_file.write(bin_formatted_data)
+                pathlib.Path(path).write_bytes(formatted_data)
             except IOError as e:
-                verbose_print(args, "%s: Cannot open file to write.\n" % path, 0)
+                verbose_print(args, 0, "%s: Cannot open file to write.\n", path)
                 print(e)
     return json_data
 
 def load_cycles(args):
-    verbose_print(args, "Loading cycle index file...\n", 1)
+    verbose_print(args, 1, "Loading cycle index file...\n")
     cycles_path = os.path.join(args.base_path, "cycles.json")
     cycles_data = load_json_file(args, cycles_path)
 
@@ -110,7 +139,7 @@ def load_cycles(args):
     return cycles_data
 
 def load_packs(args, cycles_data):
-    verbose_print(args, "Loading pack index file...\n", 1)
+    verbose_print(args, 1, "Loading pack index file...\n")
     packs_path = os.path.join(args.base_path, "packs.json")
     packs_data = load_json_file(args, packs_path)
 
@@ -120,17 +149,14 @@ def load_packs(args, cycles_data):
     for p in packs_data:
         if p["cycle_code"] == "promotional":
             p["cycle_code"] = "promo"
-        pack_filename = "{}.json".format(p["code"])
-        pack_path = os.path.join(args.pack_path, p["cycle_code"], pack_filename)
-        p['player'] = check_file_access(pack_path)
-        pack_filename = "{}_encounter.json".format(p["code"])
-        pack_path = os.path.join(args.pack_path, p["cycle_code"], pack_filename)
-        p['encounter'] = check_file_access(pack_path)
+        pack_path = f"{args.pack_path}/{p['cycle_code']}/{p['code']}"
+        p['player'] = check_file_access(f"{pack_path}.json")
+        p['encounter'] = check_file_access(f"{pack_path}_encounter.json")
 
     return packs_data
 
 def load_factions(args):
-    verbose_print(args, "Loading faction index file...\n", 1)
+    verbose_print(args, 1, "Loading faction index file...\n")
     factions_path = os.path.join(args.base_path, "factions.json")
     factions_data = load_json_file(args, factions_path)
 
@@ -140,7 +166,7 @@ def load_factions(args):
     return factions_data
 
 def load_types(args):
-    verbose_print(args, "Loading type index file...\n", 1)
+    verbose_print(args, 1, "Loading type index file...\n")
     types_path = os.path.join(args.base_path, "types.json")
     types_data = load_json_file(args, types_path)
 
@@ -150,7 +176,7 @@ def load_types(args):
     return types_data
 
 def load_sides(args):
-    verbose_print(args, "Loading side index file...\n", 1)
+    verbose_print(args, 1, "Loading side index file...\n")
     sides_path = os.path.join(args.base_path, "sides.json")
     sides_data = load_json_file(args, sides_path)
 
@@ -163,37 +189,81 @@ def parse_commandline():
     argparser = argparse.ArgumentParser(description="Validate JSON in the netrunner cards repository.")
     argparser.add_argument("-f", "--fix_formatting", default=False, action="store_true", help="write suggested formatting changes to files")
     argparser.add_argument("-v", "--verbose", default=0, action="count", help="verbose mode")
+    argparser.add_argument("-j", "--jobs", default=1, type=int, help="number of processes used to validate cards, 0 to use all CPUs (default: 1)")
     argparser.add_argument("-b", "--base_path", default=os.getcwd(), help="root directory of JSON repo (default: current directory)")
     argparser.add_argument("-p", "--pack_path", default=None, help=("pack directory of JSON repo (default: BASE_PATH/%s/)" % PACK_DIR))
     argparser.add_argument("-c", "--schema_path", default=None, help=("schema directory of JSON repo (default: BASE_PATH/%s/" % SCHEMA_DIR))
     args = argparser.parse_args()
 
+    if args.jobs < 0:
+        argparser.error("--jobs must not be negative")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+
     # Set all the necessary paths and check if they exist
     if getattr(args, "schema_path", None) is None:
         setattr(args, "schema_path", os.path.join(args.base_path,SCHEMA_DIR))
     if getattr(args, "pack_path", None) is None:
         setattr(args, "pack_path", os.path.join(args.base_path,PACK_DIR))
+    # Pack file paths are built with plain string formatting, drop any trailing separator
+    args.pack_path = os.path.normpath(args.pack_path)
     check_dir_access(args.base_path)
     check_dir_access(args.schema_path)
     check_dir_access(args.pack_path)
 
     return args
 
-def validate_card(args, card, card_schema, pack_code, factions_data, types_data):
+def validate_card(args, card, card_validator, pack_code, faction_codes, type_codes):
     global validation_errors
 
     try:
-        verbose_print(args, "Validating card %s... " % card["code"], 2)
-        jsonschema.validate(card, card_schema)
-        custom_card_check(args, card, pack_code, factions_data, types_data)
-        verbose_print(args, "OK\n", 2)
+        verbose_print(args, 2, "Validating card %s... ", card["code"])
+        validate_with(card_validator, card)
+        custom_card_check(args, card, pack_code, faction_codes, type_codes)
+        verbose_print(args, 2, "OK\n")
     except jsonschema.ValidationError as e:
-        verbose_print(args, "ERROR\n",2)
-        verbose_print(args, "Validation error in card: (pack code: '%s' card code: '%s' title: '%s')\n" % (pack_code, card.get("code"), card.get("name")), 0)
+        verbose_print(args, 2, "ERROR\n")
+        verbose_print(args, 0, "Validation error in card: (pack code: '%s' card code: '%s' title: '%s')\n", pack_code, card.get("code"), card.get("name"))
         validation_errors += 1
-        verbose_print(args, "%s: %s\n" % (e.path, e.message), 0)
+        verbose_print(args, 0, "%s: %s\n", e.path, e.message)
+
+def validate_pack_cards(args, p, card_validator, faction_codes, type_codes):
+    verbose_print(args, 1, "Validating cards from %s...\n", p["name"])
+
+    if (p['player']):
+        verbose_print(args, 1, "Validating player cards...\n")
+        pack_path = f"{args.pack_path}/{p['cycle_code']}/{p['code']}.json"
+        pack_data = load_json_file(args, pack_path)
+        if pack_data:
+            for card in pack_data:
+                validate_card(args, card, card_validator, p["code"], faction_codes, type_codes)
+    if (p['encounter']):
+        verbose_print(args, 1, "Validating encounter cards...\n")
+        pack_path = f"{args.pack_path}/{p['cycle_code']}/{p['code']}_encounter.json"
+        pack_data = load_json_file(args, pack_path)
+        if pack_data:
+            for card in pack_data:
+                validate_card(args, card, card_validator, p["code"], faction_codes, type_codes)
+
+def init_pack_cards_worker(args, card_schema, faction_codes, type_codes):
+    "Sets up a worker process for validate_pack_cards_worker(). The validator is built here as it cannot be pickled."
+    global worker_state
+    worker_state = (args, schema_validator(card_schema), faction_codes, type_codes)
+
+def validate_pack_cards_worker(p):
+    "Runs validate_pack_cards() in a worker process and returns its output along with the errors it found."
+    global formatting_errors
+    global validation_errors
+    formatting_errors = 0
+    validation_errors = 0
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        args, card_validator, faction_codes, type_codes = worker_state
+        validate_pack_cards(args, p, card_validator, faction_codes, type_codes)
+    return output.getvalue(), formatting_errors, validation_errors
 
 def validate_cards(args, packs_data, factions_data, types_data):
+    global formatting_errors
     global validation_errors
 
     card_schema_path = os.path.join(args.schema_path, "card_schema.json")
@@ -203,50 +273,49 @@ def validate_cards(args, packs_data, factions_data, types_data):
         return
     if not check_json_schema(args, CARD_SCHEMA, card_schema_path):
         return
+    faction_codes = set(f["code"] for f in factions_data)
+    type_codes = set(t["code"] for t in types_data)
 
-    for p in packs_data:
-        verbose_print(args, "Validating cards from %s...\n" % p["name"], 1)
-
-        if (p['player']):
-            verbose_print(args, "Validating player cards...\n", 1)
-            pack_path = os.path.join(args.pack_path, p["cycle_code"], "{}.json".format(p["code"]))
-            pack_data = load_json_file(args, pack_path)
-            if pack_data:
-                for card in pack_data:
-                    validate_card(args, card, CARD_SCHEMA, p["code"], factions_data, types_data)
-        if (p['encounter']):
-            verbose_print(args, "Validating encounter cards...\n", 1)
-            pack_path = os.path.join(args.pack_path, p["cycle_code"], "{}_encounter.json".format(p["code"]))
-            pack_data = load_json_file(args, pack_path)
-            if pack_data:
-                for card in pack_data:
-                    validate_card(args, card, CARD_SCHEMA, p["code"], factions_data, types_data)
+    if args.jobs == 1:
+        card_validator = schema_validator(CARD_SCHEMA)
+        for p in packs_data:
+            validate_pack_cards(args, p, card_validator, faction_codes, type_codes)
+        return
+
+    # Packs are independent from each other, validate them in parallel and
+    # print the results in the same order as the serial code path would
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs, initializer=init_pack_cards_worker, initargs=(args, CARD_SCHEMA, faction_codes, type_codes)) as executor:
+        for output, pack_formatting_errors, pack_validation_errors in executor.map(validate_pack_cards_worker, packs_data, chunksize=4):
+            sys.stdout.write(output)
+            formatting_errors += pack_formatting_errors
+            validation_errors += pack_validation_errors
 
 def validate_cycles(args, cycles_data):
     global validation_errors
 
-    verbose_print(args, "Validating cycle index file...\n", 1)
+    verbose_print(args, 1, "Validating cycle index file...\n")
     cycle_schema_path = os.path.join(args.schema_path, "cycle_schema.json")
     CYCLE_SCHEMA = load_json_file(args, cycle_schema_path)
     if not isinstance(cycles_data, list):
-        verbose_print(args, "Insides of cycle index file are not a list!\n", 0)
+        verbose_print(args, 0, "Insides of cycle index file are not a list!\n")
         return False
     if not CYCLE_SCHEMA:
         return False
     if not check_json_schema(args, CYCLE_SCHEMA, cycle_schema_path):
         return False
+    cycle_validator = schema_validator(CYCLE_SCHEMA)
 
     retval = True
     for c in cycles_data:
         try:
-            verbose_print(args, "Validating cycle %s... " % c.get("name"), 2)
-            jsonschema.validate(c, CYCLE_SCHEMA)
-            verbose_print(args, "OK\n", 2)
+            verbose_print(args, 2, "Validating cycle %s... ", c.get("name"))
+            validate_with(cycle_validator, c)
+            verbose_print(args, 2, "OK\n")
         except jsonschema.ValidationError as e:
-            verbose_print(args, "ERROR\n",2)
-            verbose_print(args, "Validation error in cycle: (code: '%s' name: '%s')\n" % (c.get("code"), c.get("name")), 0)
+            verbose_print(args, 2, "ERROR\n")
+            verbose_print(args, 0, "Validation error in cycle: (code: '%s' name: '%s')\n", c.get("code"), c.get("name"))
             validation_errors += 1
-            verbose_print(args, "%s\n" % e.message, 0)
+            verbose_print(args, 0, "%s\n", e.message)
             retval = False
 
     return retval
@@ -254,29 +323,31 @@ def validate_cycles(args, cycles_data):
 def validate_packs(args, packs_data, cycles_data):
     global validation_errors
 
-    verbose_print(args, "Validating pack index file...\n", 1)
+    verbose_print(args, 1, "Validating pack index file...\n")
     pack_schema_path = os.path.join(args.schema_path, "pack_schema.json")
     PACK_SCHEMA = load_json_file(args, pack_schema_path)
     if not isinstance(packs_data, list):
-        verbose_print(args, "Insides of pack index file are not a list!\n", 0)
+        verbose_print(args, 0, "Insides of pack index file are not a list!\n")
         return False
     if not PACK_SCHEMA:
         return False
     if not check_json_schema(args, PACK_SCHEMA, pack_schema_path):
         return False
+    pack_validator = schema_validator(PACK_SCHEMA)
+    cycle_codes = set(c["code"] for c in cycles_data)
 
     retval = True
     for p in packs_data:
         try:
-            verbose_print(args, "Validating pack %s... " % p.get("name"), 2)
-            jsonschema.validate(p, PACK_SCHEMA)
-            custom_pack_check(args, p, cycles_data)
-            verbose_print(args, "OK\n", 2)
+            verbose_print(args, 2, "Validating pack %s... ", p.get("name"))
+            validate_with(pack_validator, p)
+            custom_pack_check(args, p, cycle_codes)
+            verbose_print(args, 2, "OK\n")
         except jsonschema.ValidationError as e:
-            verbose_print(args, "ERROR\n",2)
-            verbose_print(args, "Validation error in pack: (code: '%s' name: '%s')\n" % (p.get("code"), p.get("name")), 0)
+            verbose_print(args, 2, "ERROR\n")
+            verbose_print(args, 0, "Validation error in pack: (code: '%s' name: '%s')\n", p.get("code"), p.get("name"))
             validation_errors += 1
-            verbose_print(args, "%s\n" % e.message, 0)
+            verbose_print(args, 0, "%s\n", e.message)
             retval = False
 
     return retval
@@ -284,28 +355,29 @@ def validate_packs(args, packs_data, cycles_data):
 def validate_factions(args, factions_data):
     global validation_errors
 
-    verbose_print(args, "Validating faction index file...\n", 1)
+    verbose_print(args, 1, "Validating faction index file...\n")
     faction_schema_path = os.path.join(args.schema_path, "faction_schema.json")
     FACTION_SCHEMA = load_json_file(args, faction_schema_path)
     if not isinstance(factions_data, list):
-        verbose_print(args, "Insides of faction index file are not a list!\n", 0)
+        verbose_print(args, 0, "Insides of faction index file are not a list!\n")
         return False
     if not FACTION_SCHEMA:
         return False
     if not check_json_schema(args, FACTION_SCHEMA, faction_schema_path):
         return False
+    faction_validator = schema_validator(FACTION_SCHEMA)
 
     retval = True
     for c in factions_data:
         try:
-            verbose_print(args, "Validating faction %s... " % c.get("name"), 2)
-            jsonschema.validate(c, FACTION_SCHEMA)
-            verbose_print(args, "OK\n", 2)
+            verbose_print(args, 2, "Validating faction %s... ", c.get("name"))
+            validate_with(faction_validator, c)
+            verbose_print(args, 2, "OK\n")
         except jsonschema.ValidationError as e:
-            verbose_print(args, "ERROR\n",2)
-            verbose_print(args, "Validation error in faction: (code: '%s' name: '%s')\n" % (c.get("code"), c.get("name")), 0)
+            verbose_print(args, 2, "ERROR\n")
+            verbose_print(args, 0, "Validation error in faction: (code: '%s' name: '%s')\n", c.get("code"), c.get("name"))
             validation_errors += 1
-            verbose_print(args, "%s\n" % e.message, 0)
+            verbose_print(args, 0, "%s\n", e.message)
             retval = False
 
     return retval
@@ -313,28 +385,29 @@ def validate_factions(args, factions_data):
 def validate_types(args, types_data):
     global validation_errors
 
-    verbose_print(args, "Validating type index file...\n", 1)
+    verbose_print(args, 1, "Validating type index file...\n")
     type_schema_path = os.path.join(args.schema_path, "type_schema.json")
     TYPE_SCHEMA = load_json_file(args, type_schema_path)
     if not isinstance(types_data, list):
-        verbose_print(args, "Insides of type index file are not a list!\n", 0)
+        verbose_print(args, 0, "Insides of type index file are not a list!\n")
         return False
     if not TYPE_SCHEMA:
         return False
     if not check_json_schema(args, TYPE_SCHEMA, type_schema_path):
         return False
+    type_validator = schema_validator(TYPE_SCHEMA)
 
     retval = True
     for c in types_data:
         try:
-            verbose_print(args, "Validating type %s... " % c.get("name"), 2)
-            jsonschema.validate(c, TYPE_SCHEMA)
-            verbose_print(args, "OK\n", 2)
+            verbose_print(args, 2, "Validating type %s... ", c.get("name"))
+            validate_with(type_validator, c)
+            verbose_print(args, 2, "OK\n")
         except jsonschema.ValidationError as e:
-            verbose_print(args, "ERROR\n",2)
-            verbose_print(args, "Validation error in type: (code: '%s' name: '%s')\n" % (c.get("code"), c.get("name")), 0)
+            verbose_print(args, 2, "ERROR\n")
+            verbose_print(args, 0, "Validation error in type: (code: '%s' name: '%s')\n", c.get("code"), c.get("name"))
             validation_errors += 1
-            verbose_print(args, "%s\n" % e.message, 0)
+            verbose_print(args, 0, "%s\n", e.message)
             retval = False
 
     return retval
@@ -342,51 +415,56 @@ def validate_types(args, types_data):
 def validate_sides(args, sides_data):
     global validation_errors
 
-    verbose_print(args, "Validating side index file...\n", 1)
+    verbose_print(args, 1, "Validating side index file...\n")
     side_schema_path = os.path.join(args.schema_path, "side_schema.json")
     SIDE_SCHEMA = load_json_file(args, side_schema_path)
     if not isinstance(sides_data, list):
-        verbose_print(args, "Insides of side index file are not a list!\n", 0)
+        verbose_print(args, 0, "Insides of side index file are not a list!\n")
         return False
     if not SIDE_SCHEMA:
         return False
     if not check_json_schema(args, SIDE_SCHEMA, side_schema_path):
         return False
+    side_validator = schema_validator(SIDE_SCHEMA)
 
     retval = True
     for c in sides_data:
         try:
-            verbose_print(args, "Validating side %s... " % c.get("name"), 2)
-            jsonschema.validate(c, SIDE_SCHEMA)
-            verbose_print(args, "OK\n", 2)
+            verbose_print(args, 2, "Validating side %s... ", c.get("name"))
+            validate_with(side_validator, c)
+            verbose_print(args, 2, "OK\n")
         except jsonschema.ValidationError as e:
-            verbose_print(args, "ERROR\n",2)
-            verbose_print(args, "Validation error in side: (code: '%s' name: '%s')\n" % (c.get("code"), c.get("name")), 0)
+            verbose_print(args, 2, "ERROR\n")
+            verbose_print(args, 0, "Validation error in side: (code: '%s' name: '%s')\n", c.get("code"), c.get("name"))
             validation_errors += 1
-            verbose_print(args, "%s\n" % e.message, 0)
+            verbose_print(args, 0, "%s\n", e.message)
             retval = False
 
     return retval
 
 def check_translations_simple(args, base_translations_path, locale_name, base_file_name):
     file_name = "%s.json" % (base_file_name)
-    verbose_print(args, "Loading file %s...\n" % file_name, 1)
+    verbose_print(args, 1, "Loading file %s...\n", file_name)
     file_path = os.path.join(base_translations_path, locale_name, file_name)
     if check_file_access(file_path):
         load_json_file(args, file_path)
 
 def check_translations_packs(args, base_translations_path, locale_name):
     packs_translations_path = os.path.join(base_translations_path, locale_name, 'pack')
-    cycle_dirs = os.listdir(packs_translations_path)
+    # scandir() entries cache the file type, so no extra stat() is needed per entry
+    with os.scandir(packs_translations_path) as it:
+        cycle_dirs = [e for e in it if e.is_dir()]
     for cycle_dir in cycle_dirs:
-        file_names = os.listdir(os.path.join(packs_translations_path, cycle_dir))
-        for file_name in file_names:
-            verbose_print(args, "Loading file %s...\n" % file_name, 1)
-            file_path = os.path.join(packs_translations_path, cycle_dir, file_name)
-            load_json_file(args, file_path)
+        with os.scandir(cycle_dir.path) as it:
+            for file_entry in it:
+                if not (file_entry.is_file() and file_entry.name.endswith(".json")):
+                    verbose_print(args, 1, "Ignoring %s...\n", file_entry.path)
+                    continue
+                verbose_print(args, 1, "Loading file %s...\n", file_entry.name)
+                load_json_file(args, file_entry.path)
 
 def check_translations(args, base_translations_path, locale_name):
-    verbose_print(args, "Loading Translations for %s...\n" % locale_name, 1)
+    verbose_print(args, 1, "Loading Translations for %s...\n", locale_name)
     translations_path = os.path.join(base_translations_path, locale_name)
     check_translations_simple(args, base_translations_path, locale_name, 'cycles')
     check_translations_simple(args, base_translations_path, locale_name, 'factions')
@@ -395,25 +473,27 @@ def check_translations(args, base_translations_path, locale_name):
     check_translations_packs(args, base_translations_path, locale_name)
 
 def check_all_translations(args):
-    verbose_print(args, "Loading Translations...\n", 1)
+    verbose_print(args, 1, "Loading Translations...\n")
     base_translations_path = os.path.join(args.base_path, "translations")
-    translations_directories = os.listdir(base_translations_path)
+    with os.scandir(base_translations_path) as it:
+        translations_directories = [e.name for e in it if e.is_dir()]
     for locale_name in translations_directories:
         check_translations(args, base_translations_path, locale_name)
 
 def check_mwl(args):
-    verbose_print(args, "Loading MWL...\n", 1)
+    verbose_print(args, 1, "Loading MWL...\n")
     mwl_path = os.path.join(args.base_path, "mwl.json")
     load_json_file(args, mwl_path)
 
 def check_prebuilt(args):
-    verbose_print(args, "Loading Prebuilts...\n", 1)
+    verbose_print(args, 1, "Loading Prebuilts...\n")
     mwl_path = os.path.join(args.base_path, "prebuilts.json")
     load_json_file(args, mwl_path)
 
-def verbose_print(args, text, minimum_verbosity=0):
+def verbose_print(args, minimum_verbosity, fmt, *fmt_args):
+    "Prints fmt % fmt_args if verbose mode is at least minimum_verbosity. Formatting is skipped for messages that are not printed."
     if args.verbose >= minimum_verbosity:
-        sys.stdout.write(text)
+        sys.stdout.write(fmt % fmt_args if fmt_args else fmt)
 
 def main():
     # Initialize global counters for encountered validation errors
@@ -436,7 +516,7 @@ def main():
         validate_cards(args, packs, factions, types)
         check_all_translations(args)
     else:
-        verbose_print(args, "Skipping card validation...\n", 0)
+        verbose_print(args, 0, "Skipping card validation...\n")
 
     sys.stdout.write("Found %s formatting and %s validation errors\n" % (formatting_errors, validation_errors))
     if formatting_errors == 0 and validation_errors == 0: